@@ -10,50 +10,358 @@ PRIVACY NOTICE:
 - All examples in documentation use masked data (XXX-XXXX-XXXX)
 """
 
+import hashlib
+import heapq
+import os
 import re
-from collections import defaultdict
+import shutil
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+import reportlab
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import cm
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_CENTER
 from reportlab.pdfgen import canvas
 
 
-def extract_price(text):
+# Precompiled regex patterns (compiled once at import, reused for every line)
+# Price patterns: rb (thousand), jt (million), long number format with dots
+_RE_JT = re.compile(r'(\d+[,\.]?\d*)\s*jt\b', re.IGNORECASE)
+_RE_RB = re.compile(r'(\d+[,\.]?\d*)\s*rb\b', re.IGNORECASE)
+_RE_LONGNUM = re.compile(r'(\d{1,3}(?:\.\d{3})+(?:,\d+)?)')
+# Every price pattern needs a digit: lines without one can never be items
+_RE_DIGIT = re.compile(r'\d')
+
+# Suffix price patterns in priority order: (required literal, pattern, multiplier)
+_PRICE_SUFFIXES = [
+    ('jt', _RE_JT, 1000000),  # million
+    ('rb', _RE_RB, 1000),  # thousand
+]
+
+# Price removal patterns (same as price patterns but including leading whitespace)
+# Each pattern is paired with the literal it requires, used as a cheap pre-check
+_RE_PRICE_REMOVE = [
+    ('jt', re.compile(r'\s*\d+[,\.]?\d*\s*jt\b', re.IGNORECASE)),  # million
+    ('rb', re.compile(r'\s*\d+[,\.]?\d*\s*rb\b', re.IGNORECASE)),  # thousand
+    ('.', re.compile(r'\s*\d{1,3}(?:\.\d{3})+(?:,\d+)?', re.IGNORECASE)),  # long number format
+]
+
+# Notes and quantity in parentheses
+_RE_ITEM_TRAILING_NOTES = re.compile(r'\s+\([^)]*\)\s*$')
+_RE_QTY = re.compile(r'\(\+\s*(\d+)\s*\w*\)', re.IGNORECASE)
+_RE_NOTES = re.compile(r'\(([^)]+)\)')
+_RE_QTY_CONTENT = re.compile(r'^\+\s*\d+', re.IGNORECASE)
+
+# Customer line cleanup patterns
+_RE_OK_BEFORE_PAREN = re.compile(r'\s+ok\s*\(', re.IGNORECASE)
+# One trailing "(...) ok", "(...)ok", "(...)" or " ok" at the end of a customer line
+# (not repeated with "+": "(...) ok" matches two ways, so a repeated group backtracks exponentially)
+_RE_TRAILING_NOISE = re.compile(r'(?:\s*\([^)]*\)\s*ok|\s*\([^)]*\)|\s+ok)\s*$', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+
+# Phone number patterns: (required literal, pattern)
+# A pattern is only scanned when its leading literal is in the line, so "08..." lines skip the "+62" patterns
+_RE_PHONES = [
+    ('+62', re.compile(r'\+62\s+\d{3}-\d{4}-\d{4}')),  # +62 XXX-XXXX-XXXX format (3-4-4)
+    ('+62', re.compile(r'\+62\s+\d{3}-\d{4}-\d{3}')),  # +62 XXX-XXXX-XXX format (3-4-3)
+    ('+62', re.compile(r'\+62\s+\d{3}-\d{3}-\d{3}')),  # +62 XXX-XXX-XXX format (3-3-3)
+    ('+62', re.compile(r'\+62\s+\d{2}-\d{4}-\d{4}')),  # +62 81-1234-5678 format (2-4-4)
+    ('+62', re.compile(r'\+62\s+\d{3}\s+\d{4}\s+\d{4}')),  # +62 XXX XXXX XXXX format with spaces (3-4-4)
+    ('+62', re.compile(r'\+62\s+\d{2}\s+\d{4}\s+\d{4}')),  # +62 81 1234 5678 format with spaces (2-4-4)
+    ('+62', re.compile(r'\+62\s+\d{2,3}[-.\s]\d{3,4}[-.\s]\d{3,4}[-.\s]\d{3,4}')),  # +62 with separator
+    ('+62', re.compile(r'\+62\s*\d{2,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}')),  # +62 general format
+    ('0', re.compile(r'0\d{2,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}')),  # 08 format with separator
+    ('0', re.compile(r'0\d{10,12}(?=\s|$)')),  # 08XXXXXXXXXX format without separator
+]
+_RE_NONDIGIT_PLUS = re.compile(r'[^\d+]')
+
+# Report colors (hex strings parsed once)
+_COLOR_TITLE = colors.HexColor('#1a1a1a')
+_COLOR_HEADING = colors.HexColor('#2c3e50')
+_COLOR_TABLE_HEADER = colors.HexColor('#34495e')
+_COLOR_HIGHLIGHT = colors.HexColor('#ecf0f1')  # Grand total rows and summary table
+
+# Shared report styles (the sample style sheet is built once per process, not once per report)
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    textColor=_COLOR_TITLE,
+    spaceAfter=30,
+    alignment=TA_CENTER
+)
+
+_CUSTOMER_HEADER_STYLE = ParagraphStyle(
+    'CustomerHeader',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=_COLOR_HEADING,
+    spaceAfter=10,
+    spaceBefore=20
+)
+
+# Section headings of the total revenue report
+_SUMMARY_STYLE = ParagraphStyle(
+    'Summary',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    fontName='Helvetica-Bold',
+    spaceAfter=20
+)
+
+_DETAIL_TITLE_STYLE = ParagraphStyle(
+    'DetailTitle',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=_COLOR_HEADING,
+    spaceAfter=10,
+    spaceBefore=20
+)
+
+# Table style for every customer table in the billing report (built once, reused per customer)
+_BILLING_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 11),
+    ('BACKGROUND', (0, -1), (-1, -1), _COLOR_HIGHLIGHT),
+    ('SPAN', (3, -1), (4, -1)),  # Grand total amount gets both currency columns
+])
+
+# Table styles for the top spender, top item and total revenue reports
+_TOP_SPENDER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (3, 0), (3, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+])
+
+_TOP_ITEM_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+])
+
+_OMZET_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _COLOR_HIGHLIGHT),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+_OMZET_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (4, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -2), 10),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, -1), (-1, -1), 11),
+    ('BACKGROUND', (0, -1), (-1, -1), _COLOR_HIGHLIGHT),
+    ('ALIGN', (1, -1), (1, -1), 'LEFT'),  # Grand total label
+    ('SPAN', (3, -1), (4, -1)),  # Grand total amount gets both currency columns
+])
+
+# Same as _OMZET_TABLE_STYLE for the leading chunks of a long detail table (no grand total row)
+_OMZET_BODY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _COLOR_TABLE_HEADER),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (4, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+])
+
+# ReportLab re-measures every remaining row each time a table is split across pages,
+# so one long table costs O(rows^2); long tables are emitted in chunks of this many rows
+_TABLE_CHUNK_ROWS = 100
+
+# Table column widths
+_BILLING_COL_WIDTHS = (1*cm, 8*cm, 2*cm, 3*cm, 3*cm)
+_TOP_SPENDER_COL_WIDTHS = (1.5*cm, 6*cm, 5*cm, 4*cm)
+_TOP_ITEM_COL_WIDTHS = (1.5*cm, 12*cm, 4*cm)
+_OMZET_SUMMARY_COL_WIDTHS = (8*cm, 8*cm)
+_OMZET_COL_WIDTHS = (1.5*cm, 7*cm, 2.5*cm, 3*cm, 3*cm)
+
+# Page number position (bottom right) in the billing report
+_PAGE_NUMBER_X = A4[0] - 2*cm
+_PAGE_NUMBER_Y = 2*cm
+
+# Rendered PDFs are kept per input hash so unchanged input skips ReportLab entirely
+# (next to this script, not the working directory, so every run shares one cache folder)
+_REPORT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+_REPORT_CACHE_SIZE = 5  # Most recently used inputs to keep
+
+# Thousands separator for format_currency (comma -> dot)
+_COMMA_TO_DOT = str.maketrans({',': '.'})
+
+# Translation table for normalize_unicode (single pass instead of chained str.replace)
+_UNICODE_TABLE = str.maketrans({
+    # Unicode space characters -> regular space
+    '\u2009': ' ',  # Thin space
+    '\u200A': ' ',  # Hair space
+    '\u202F': ' ',  # Narrow no-break space
+    '\u00A0': ' ',  # Non-breaking space
+    '\u2000': ' ',  # En quad
+    '\u2001': ' ',  # Em quad
+    '\u2002': ' ',  # En space
+    '\u2003': ' ',  # Em space
+    '\u2004': ' ',  # Three-per-em space
+    '\u2005': ' ',  # Four-per-em space
+    '\u2006': ' ',  # Six-per-em space
+    '\u2007': ' ',  # Figure space
+    '\u2008': ' ',  # Punctuation space
+    # Zero-width and directional formatting characters -> removed
+    '\u200B': None,  # Zero-width space
+    '\u200C': None,  # Zero-width non-joiner
+    '\u200D': None,  # Zero-width joiner
+    '\uFEFF': None,  # Zero-width no-break space
+    '\u202A': None,  # Left-to-right embedding
+    '\u202B': None,  # Right-to-left embedding
+    '\u202C': None,  # Pop directional formatting
+    '\u202D': None,  # Left-to-right override
+    '\u202E': None,  # Right-to-left override
+    '\u2066': None,  # Left-to-right isolate
+    '\u2067': None,  # Right-to-left isolate
+    '\u2068': None,  # First strong isolate
+    '\u2069': None,  # Pop directional isolate
+    '\u200E': None,  # Left-to-right mark
+    '\u200F': None,  # Right-to-left mark
+    '\u2028': ' ',  # Line separator -> space
+    '\u2029': ' ',  # Paragraph separator -> space
+    # Unicode dash/hyphen -> regular dash
+    '\u2011': '-',  # Non-breaking hyphen
+    '\u2012': '-',  # Figure dash
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2015': '-',  # Horizontal bar
+    '\u2212': '-',  # Minus sign
+    '\uFE63': '-',  # Small hyphen-minus
+    '\uFF0D': '-',  # Fullwidth hyphen-minus
+    '\u00AD': '-',  # Soft hyphen
+    '\u2010': '-',  # Hyphen
+})
+
+
+def extract_price_and_strip(text):
     """
-    Extract price from item text.
+    Extract price from item text and remove it from the text in the same scan.
     Format: rb (thousand), jt (million), or numbers with dots/commas
     Example: "195rb", "1.989.000", "3,4jt" = 3,400,000
     Priority: search for rb/jt patterns first, then long number format
+    The price is removed using the span of the match that was found,
+    so the price regexes do not have to run a second time.
+    Example: "Product name isi 40 pcs 439rb" -> (439000, "Product name isi 40 pcs")
+    Returns: (price, cleaned_text) where price is None and cleaned_text is text if not found
     """
+    # Quick check: without a single digit there is no price to find
+    if not _RE_DIGIT.search(text):
+        return None, text
+    
+    # Cheap literal pre-check: only run a regex if its required literal is present
+    # (customer lines usually contain none of "jt", "rb" or ".")
+    lowered = text.lower()
+    price = None
+    match = None
+    
     # Pattern to search for price with priority
     # 1. Search for patterns with rb/jt (more specific)
-    patterns = [
-        (r'(\d+[,\.]?\d*)\s*jt\b', lambda m: float(m.group(1).replace(',', '.')) * 1000000),  # million
-        (r'(\d+[,\.]?\d*)\s*rb\b', lambda m: float(m.group(1).replace(',', '.')) * 1000),  # thousand
-    ]
-    
-    for pattern, converter in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
+    for literal, pattern, multiplier in _PRICE_SUFFIXES:
+        if literal not in lowered:
+            continue
+        found = pattern.search(text)
+        if found:
             try:
-                return int(converter(match))
+                price = int(float(found.group(1).replace(',', '.')) * multiplier)
+                match = found
+                break
             except:
                 continue
     
     # 2. If no rb/jt found, search for long number format (minimum 4 digits or with dots)
-    long_number_pattern = r'(\d{1,3}(?:\.\d{3})+(?:,\d+)?)'
-    match = re.search(long_number_pattern, text)
-    if match:
-        try:
-            num_str = match.group(1).replace('.', '').replace(',', '.')
-            return int(float(num_str))
-        except:
-            pass
-    
-    return None
+    if match is None and '.' in text:
+        found = _RE_LONGNUM.search(text)
+        if found:
+            try:
+                num_str = found.group(1).replace('.', '').replace(',', '.')
+                price = int(float(num_str))
+                match = found
+            except:
+                pass
+    
+    if match is None:
+        return None, text
+    
+    # Remove the matched price (and whitespace before it) using its span
+    cleaned = text[:match.start()].rstrip() + text[match.end():]
+    # If another price may still be left in the text (rare), remove all prices the usual way
+    lowered = cleaned.lower()
+    if 'jt' in lowered or 'rb' in lowered or '.' in cleaned:
+        return price, remove_price_from_item_name(text)
+    return price, cleaned.strip()
+
+
+def parse_item_line(line):
+    """
+    Parse an item line: extract the price and clean the item name in one call.
+    Example: "Product name 439rb (pre-order)" -> ("Product name", 439000)
+    Returns: (item_name, price), or (None, None) if the line has no price (not an item line)
+    """
+    price, item_name = extract_price_and_strip(line)
+    if price is None:
+        return None, None
+    
+    # Item name is the line without price (removed by extract_price_and_strip)
+    # Remove notes in parentheses that exist after price or at the end
+    item_name = remove_notes_from_item_name(item_name)
+    # Intern the name: it is the hottest dict key in the report builders
+    return sys.intern(item_name), price
 
 
 def remove_price_from_item_name(text):
@@ -61,18 +369,16 @@ def remove_price_from_item_name(text):
     Remove price from item name.
     Example: "Product name isi 40 pcs 439rb" -> "Product name isi 40 pcs"
     """
-    # Pattern to remove price (same as extract_price but for removal)
-    price_patterns = [
-        r'\s*\d+[,\.]?\d*\s*jt\b',  # million
-        r'\s*\d+[,\.]?\d*\s*rb\b',  # thousand
-        r'\s*\d{1,3}(?:\.\d{3})+(?:,\d+)?',  # long number format
-    ]
-    
+    # Pattern to remove price (same as extract_price_and_strip but for removal)
+    # Skip a pattern entirely when its required literal is absent
     result = text
-    for pattern in price_patterns:
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE).strip()
+    lowered = text.lower()
+    for literal, pattern in _RE_PRICE_REMOVE:
+        if literal in lowered:
+            result = pattern.sub('', result)
+            lowered = result.lower()
     
-    return result
+    return result.strip()
 
 
 def remove_notes_from_item_name(text):
@@ -90,9 +396,12 @@ def remove_notes_from_item_name(text):
     
     Pattern: Remove parentheses at the end if there is space before parentheses (format: "text (notes)")
     """
+    if '(' not in text:
+        return text.strip()
+    
     # Remove parentheses at the end if there is space before parentheses (indicating separate note)
     # Pattern: space + parentheses at end of string
-    result = re.sub(r'\s+\([^)]*\)\s*$', '', text).strip()
+    result = _RE_ITEM_TRAILING_NOTES.sub('', text).strip()
     return result
 
 
@@ -103,15 +412,17 @@ def extract_quantity_from_customer_name(text):
     Example: "Customer Name (+ 11 pack)" -> quantity = 11, cleaned_name = "Customer Name"
     Returns: (quantity, cleaned_name) where quantity is int or None if not found
     """
+    if '(+' not in text:
+        return None, text
+    
     # Pattern to search for (+number) or (+ number) with various units (box, pack, piece, etc.)
     # Ignore unit, only extract number
-    quantity_pattern = r'\(\+\s*(\d+)\s*\w*\)'
-    match = re.search(quantity_pattern, text, re.IGNORECASE)
+    match = _RE_QTY.search(text)
     
     if match:
         quantity = int(match.group(1))
         # Remove pattern from name
-        cleaned_name = re.sub(quantity_pattern, '', text, flags=re.IGNORECASE).strip()
+        cleaned_name = _RE_QTY.sub('', text).strip()
         return quantity, cleaned_name
     
     return None, text
@@ -126,27 +437,70 @@ def extract_notes_from_customer_name(text):
     Example: "Customer Name (+10 box)" -> notes = None (this is quantity, not a note)
     Returns: (notes, cleaned_name) where notes is string or None
     """
-    # Find all parentheses in text
-    # Pattern to search for parentheses that are not quantity format (+number)
-    notes_pattern = r'\(([^)]+)\)'
-    matches = list(re.finditer(notes_pattern, text))
-    
-    if matches:
-        # Find parentheses that are not quantity format
-        for match in reversed(matches):  # Start from the rightmost
-            content = match.group(1).strip()
-            # Check if this is quantity format (+number or + number)
-            if not re.match(r'^\+\s*\d+', content, re.IGNORECASE):
-                # This is a note, not quantity
-                notes = f"({content})"
-                # Remove this parentheses from name
-                before = text[:match.start()].strip()
-                after = text[match.end():].strip()
-                cleaned_name = f"{before} {after}".strip()
-                cleaned_name = re.sub(r'\s+', ' ', cleaned_name).strip()  # Normalize spaces
-                return notes, cleaned_name
-    
-    return None, text
+    if '(' not in text:
+        return None, text
+    
+    # Common case: a single opening parenthesis, located with plain string
+    # scans instead of collecting regex matches
+    if text.count('(') == 1:
+        start = text.find('(')
+        end = text.find(')', start)
+        if end <= start + 1:
+            # Unclosed or empty parentheses
+            return None, text
+        content = text[start + 1:end].strip()
+        # Check if this is quantity format (+number or + number)
+        if _RE_QTY_CONTENT.match(content):
+            return None, text
+        notes = f"({content})"
+        cleaned_name = f"{text[:start].strip()} {text[end + 1:].strip()}".strip()
+        cleaned_name = _RE_WS.sub(' ', cleaned_name).strip()  # Normalize spaces
+        return notes, cleaned_name
+    
+    # Find the rightmost parentheses that are not quantity format (+number)
+    # Scanning forward and keeping the last one avoids building and reversing a match list
+    notes_match = None
+    for match in _RE_NOTES.finditer(text):
+        # Check if this is quantity format (+number or + number)
+        if not _RE_QTY_CONTENT.match(match.group(1).strip()):
+            notes_match = match
+    
+    if notes_match is None:
+        return None, text
+    
+    # This is a note, not quantity
+    notes = f"({notes_match.group(1).strip()})"
+    # Remove this parentheses from name
+    before = text[:notes_match.start()].strip()
+    after = text[notes_match.end():].strip()
+    cleaned_name = f"{before} {after}".strip()
+    cleaned_name = _RE_WS.sub(' ', cleaned_name).strip()  # Normalize spaces
+    return notes, cleaned_name
+
+
+def remove_trailing_noise_from_customer_name(text):
+    """
+    Remove trailing "(...) ok", "(...)ok", "(...)" and " ok" from customer name, one group at a time.
+    Example: "Customer Name (lunas) ok (transfer)" -> "Customer Name"
+    Each search starts where the last group can begin instead of at the start of the line,
+    so a long run of stacked groups is stripped in linear time.
+    """
+    while True:
+        # Text before the last group: without its optional "ok", it ends with ")" if the group has parentheses
+        tail = text.rstrip()
+        if tail[-2:].lower() == 'ok':
+            tail = tail[:-2].rstrip()
+        if tail.endswith(')'):
+            # The "(" cannot be before the previous ")" ([^)] in the pattern)
+            start = text.rfind(')', 0, len(tail) - 1) + 1
+        else:
+            # Only " ok" can match, right after the remaining text
+            start = len(tail)
+        
+        match = _RE_TRAILING_NOISE.search(text, start)
+        if match is None:
+            return text
+        text = text[:match.start()]
 
 
 def normalize_unicode(text):
@@ -154,58 +508,12 @@ def normalize_unicode(text):
     Normalize unicode characters to standard characters.
     Remove control characters, non-breaking spaces, etc.
     """
-    if not text:
+    # Quick check: every character in the table is non-ASCII, so pure ASCII text
+    # (most lines) is already normalized and skips the translate pass
+    if not text or text.isascii():
         return text
     
-    # Normalize unicode space characters to regular space
-    text = text.replace('\u2009', ' ')  # Thin space
-    text = text.replace('\u200A', ' ')  # Hair space
-    text = text.replace('\u202F', ' ')  # Narrow no-break space
-    text = text.replace('\u00A0', ' ')   # Non-breaking space
-    text = text.replace('\u2000', ' ')  # En quad
-    text = text.replace('\u2001', ' ')  # Em quad
-    text = text.replace('\u2002', ' ')  # En space
-    text = text.replace('\u2003', ' ')  # Em space
-    text = text.replace('\u2004', ' ')  # Three-per-em space
-    text = text.replace('\u2005', ' ')  # Four-per-em space
-    text = text.replace('\u2006', ' ')  # Six-per-em space
-    text = text.replace('\u2007', ' ')  # Figure space
-    text = text.replace('\u2008', ' ')  # Punctuation space
-    text = text.replace('\u2009', ' ')  # Thin space
-    text = text.replace('\u200A', ' ')  # Hair space
-    
-    # Remove zero-width characters
-    text = text.replace('\u200B', '')   # Zero-width space
-    text = text.replace('\u200C', '')   # Zero-width non-joiner
-    text = text.replace('\u200D', '')   # Zero-width joiner
-    text = text.replace('\uFEFF', '')   # Zero-width no-break space
-    text = text.replace('\u202A', '')   # Left-to-right embedding
-    text = text.replace('\u202B', '')   # Right-to-left embedding
-    text = text.replace('\u202C', '')   # Pop directional formatting
-    text = text.replace('\u202D', '')   # Left-to-right override
-    text = text.replace('\u202E', '')   # Right-to-left override
-    text = text.replace('\u2066', '')   # Left-to-right isolate
-    text = text.replace('\u2067', '')   # Right-to-left isolate
-    text = text.replace('\u2068', '')   # First strong isolate
-    text = text.replace('\u2069', '')   # Pop directional isolate
-    text = text.replace('\u200E', '')   # Left-to-right mark
-    text = text.replace('\u200F', '')   # Right-to-left mark
-    text = text.replace('\u2028', ' ')  # Line separator -> space
-    text = text.replace('\u2029', ' ')  # Paragraph separator -> space
-    
-    # Normalize unicode dash/hyphen to regular dash
-    text = text.replace('\u2011', '-')  # Non-breaking hyphen
-    text = text.replace('\u2012', '-')  # Figure dash
-    text = text.replace('\u2013', '-')  # En dash
-    text = text.replace('\u2014', '-')  # Em dash
-    text = text.replace('\u2015', '-')  # Horizontal bar
-    text = text.replace('\u2212', '-')  # Minus sign
-    text = text.replace('\uFE63', '-')  # Small hyphen-minus
-    text = text.replace('\uFF0D', '-')  # Fullwidth hyphen-minus
-    text = text.replace('\u00AD', '-')  # Soft hyphen
-    text = text.replace('\u2010', '-')  # Hyphen
-    
-    return text
+    return text.translate(_UNICODE_TABLE)
 
 
 def normalize_phone(phone):
@@ -213,18 +521,59 @@ def normalize_phone(phone):
     if not phone:
         return None
     # Remove all non-digit characters except +
-    phone_clean = re.sub(r'[^\d+]', '', phone)
+    phone_clean = _RE_NONDIGIT_PLUS.sub('', phone)
     # Normalize format: +62 or 0 at the beginning to standard format
+    # (slice off the fixed-length prefix instead of scanning with replace)
     if phone_clean.startswith('+62'):
-        phone_clean = phone_clean.replace('+62', '0')
+        phone_clean = '0' + phone_clean[3:]
     elif phone_clean.startswith('62'):
         phone_clean = '0' + phone_clean[2:]
-    # Ensure it starts with 0
-    if not phone_clean.startswith('0'):
+    elif not phone_clean.startswith('0'):
+        # Ensure it starts with 0
         phone_clean = '0' + phone_clean
     return phone_clean
 
 
+def format_phone_62(phone):
+    """
+    Format a local phone number (starting with 0) to +62 format.
+    Example: "08XXXXXXXXXX" -> "+62 XXX-XXXX-XXXX"
+    Numbers with 9 to 11 digits after the leading 0 are formatted; anything else is returned unchanged.
+    """
+    # Remove all non-digits to get only numbers
+    digits = ''.join(filter(str.isdecimal, phone))
+    if 10 <= len(digits) <= 12 and digits.startswith('0'):
+        # Remove leading 0 and format to +62 with dash:
+        # XXX-XXXX-XX, XXX-XXXX-XXX or XXX-XXXX-XXXX (all share the same split points)
+        digits = digits[1:]
+        return f"+62 {digits[0:3]}-{digits[3:7]}-{digits[7:]}"
+    return phone
+
+
+def find_phone_match(text):
+    """
+    Find the phone number in a customer line.
+    Every phone pattern is tried and the match that ends furthest right wins
+    (on a tie, the earlier pattern wins), so with two numbers on one line the last one is taken.
+    Example: "Budi 081234567890 082233445566" -> match for "082233445566"
+    Returns: the match object, or None if the line has no phone number
+    """
+    # Take the rightmost (last) one - this is usually the correct phone number
+    phone_match = None
+    for literal, pattern in _RE_PHONES:
+        # Cheap literal pre-check: a pattern cannot match without its leading literal
+        if literal not in text:
+            continue
+        # One pattern's matches don't overlap, so its last match also ends furthest right
+        last_match = None
+        for last_match in pattern.finditer(text):
+            pass
+        # Strictly greater: on a tie the earlier pattern keeps the match
+        if last_match is not None and (phone_match is None or last_match.end() > phone_match.end()):
+            phone_match = last_match
+    return phone_match
+
+
 def normalize_customer_name(name):
     """Normalize customer name (case-insensitive)"""
     if not name:
@@ -241,10 +590,12 @@ def get_customer_key(name, phone):
     normalized_phone = normalize_phone(phone)
     normalized_name = normalize_customer_name(name)
     
+    # Keys are interned so the many dict lookups in the report builders
+    # compare them by identity
     if normalized_phone:
-        return f"{normalized_phone}_{normalized_name}"
+        return sys.intern(f"{normalized_phone}_{normalized_name}")
     else:
-        return f"NO_PHONE_{normalized_name}"
+        return sys.intern(f"NO_PHONE_{normalized_name}")
 
 
 def parse_input_file(filename):
@@ -255,267 +606,217 @@ def parse_input_file(filename):
             {
                 'name': 'Item name',
                 'price': 125000,
-                'customers': [
-                    {'name': 'Customer', 'phone': '+62...', 'checked': True/False}
-                ]
+                'total_quantity': 2  # Sum of checked quantities
             }
         ],
         'customers': {
-            'customer_key': {'name': 'Customer', 'phone': '+62...'}
+            'customer_key': {'name': 'Customer', 'phone': '+62...', 'sort_key': 'customer'}
+        },
+        'totals': {
+            'price_by_name': {'Item name': 125000},
+            'customer_items': {
+                'customer_key': [('Item name', '(notes)', 2)]
+            },
+            'spender_totals': {'customer_key': 250000},
+            'item_stats': {'Item name': [125000, 2, 250000]},  # [unit price, quantity, revenue]
+            'total_omzet': 250000,
+            'total_quantity': 2,
+            'total_items_sold': 1
         }
     }
+    The report totals are accumulated while parsing, so no per-entry customer
+    lists are kept on the items. Only checked customer entries are counted.
+    When several items share a name, the first one's price is used for billing
+    and spending, while revenue uses each item's own price.
     """
     items = []
     customers = {}
     current_item = None
     skip_section = False
     
+    # Report totals, updated as checked customer entries are parsed
+    price_by_name = {}
+    tally = Counter()
+    spender_totals = defaultdict(int)
+    
+    # Read the whole file in one call (single decode) instead of iterating line by line
     with open(filename, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
+        data = f.read()
+    
+    # Normalize unicode at the beginning (before all processing), in one translate
+    # pass over the whole file instead of one call per line
+    data = normalize_unicode(data)
+    
+    # Strip every line and skip empty lines in one batched pass
+    lines = [line for line in map(str.strip, data.split('\n')) if line]
+    
+    for line in lines:
+        # Check if entering "Product REQUEST cek harga" section
+        if "Product REQUEST cek harga" in line:
+            skip_section = True
+            continue
+        
+        # Skip all items in that section
+        if skip_section:
+            continue
+        
+        # Check if this is a new item (has price in line)
+        item_name, price = parse_item_line(line)
+        if price is not None:
+            # Create new item (stored right away; quantities are added through current_item)
+            items.append({
+                'name': item_name,
+                'price': price,
+                'total_quantity': 0  # Sum of checked quantities, kept up to date below
+            })
+            current_item = items[-1]
+            # First occurrence wins, same as a linear scan over items
+            billed_price = price_by_name.setdefault(item_name, price)
+        else:
+            # This is a customer line
+            if current_item is None:
+                continue
             
-            # Skip empty lines
-            if not line:
+            # Parse customer line
+            # Format: "- [x] Customer Name +62..." (checked), or "- [ ] ...", "- [] ...",
+            # "1. Customer Name" and "- Customer Name" (not checked)
+            # Only checked customers are added to the reports, so every other line is
+            # skipped here instead of being fully parsed and then discarded
+            if '- [x]' not in line:
                 continue
+            customer_text = line.replace('- [x]', '').strip()
             
-            # Normalize unicode at the beginning (before all processing)
-            line = normalize_unicode(line)
+            # Extract quantity first (before removing other parentheses)
+            quantity, customer_text_temp = extract_quantity_from_customer_name(customer_text)
+            if quantity is None:
+                quantity = 1  # Default quantity = 1
+            else:
+                customer_text = customer_text_temp
             
-            # Check if entering "Product REQUEST cek harga" section
-            if "Product REQUEST cek harga" in line:
-                skip_section = True
-                continue
+            # Extract notes (notes in parentheses) to be added to item name
+            # Notes must be extracted AFTER quantity (because quantity format also uses parentheses)
+            notes, customer_text = extract_notes_from_customer_name(customer_text)
             
-            # Skip all items in that section
-            if skip_section:
-                continue
+            # Remove "ok" at the end (case-insensitive) and possible text in parentheses
+            # Order is important: 
+            # 1. Remove "ok" that exists before parentheses
+            # 2. Remove the whole run of trailing parentheses (with or without "ok" after) and trailing "ok"
+            #    (remaining parentheses after extracting notes and quantity)
+            if '(' in customer_text:
+                customer_text = _RE_OK_BEFORE_PAREN.sub(' (', customer_text)  # Remove "ok" before parentheses
+            customer_text = customer_text.strip()
+            # Trailing noise always ends with ")" or "ok", so most lines skip the regex entirely
+            if customer_text.endswith(')') or customer_text[-2:].lower() == 'ok':
+                customer_text = remove_trailing_noise_from_customer_name(customer_text)
+            # Normalize double spaces to single space
+            customer_text = _RE_WS.sub(' ', customer_text).strip()
             
-            # Check if this is a new item (has price in line)
-            price = extract_price(line)
-            if price is not None:
-                # Save previous item if exists
-                if current_item:
-                    items.append(current_item)
-                
-                # Extract item name without price
-                item_name = remove_price_from_item_name(line)
-                # Remove notes in parentheses that exist after price or at the end
-                item_name = remove_notes_from_item_name(item_name)
+            # Extract name and phone number
+            # Strategy: find all possible phone numbers, take the rightmost (last) one
+            phone_match = find_phone_match(customer_text)
+            
+            if phone_match:
+                phone = phone_match.group(0).strip()
+                name = customer_text[:phone_match.start()].strip()
                 
-                # Create new item
-                current_item = {
-                    'name': item_name,
-                    'price': price,
-                    'customers': []
-                }
+                # Normalize phone number: if starts with 0, change to +62
+                if phone.startswith('0'):
+                    phone = format_phone_62(phone)
             else:
-                # This is a customer line
-                if current_item is None:
-                    continue
-                
-                # Parse customer line
-                # Format: "- [x] Customer Name +62..." or "1. Customer Name +62..."
-                checked = False
-                customer_text = line
-                
-                # Check for checkbox [x]
-                if '- [x]' in line:
-                    checked = True
-                    customer_text = line.replace('- [x]', '').strip()
-                elif '- [ ]' in line or '- []' in line:
-                    checked = False
-                    customer_text = line.replace('- [ ]', '').replace('- []', '').strip()
-                elif re.match(r'^\d+\.', line):
-                    # Format "1. Customer Name"
-                    checked = False
-                    customer_text = re.sub(r'^\d+\.\s*', '', line).strip()
-                elif line.startswith('- '):
-                    # Format "- Customer Name" (without checkbox)
-                    checked = False
-                    customer_text = line.replace('- ', '').strip()
-                
-                # Unicode normalization already done at the beginning, but ensure again
-                customer_text = normalize_unicode(customer_text)
-                
-                # Extract quantity first (before removing other parentheses)
-                quantity, customer_text_temp = extract_quantity_from_customer_name(customer_text)
-                if quantity is None:
-                    quantity = 1  # Default quantity = 1
-                else:
-                    customer_text = customer_text_temp
-                
-                # Extract notes (notes in parentheses) to be added to item name
-                # Only if customer is checked [x]
-                # Notes must be extracted AFTER quantity (because quantity format also uses parentheses)
-                notes = None
-                if checked:
-                    notes, customer_text = extract_notes_from_customer_name(customer_text)
-                
-                # Remove "ok" at the end (case-insensitive) and possible text in parentheses
-                # Order is important: 
-                # 1. Remove "ok" that exists before parentheses
-                # 2. Remove parentheses along with "ok" that may exist after (with or without space)
-                # 3. Remove "ok" at the end if still exists
-                customer_text = re.sub(r'\s+ok\s*\(', ' (', customer_text, flags=re.IGNORECASE).strip()  # Remove "ok" before parentheses
-                customer_text = re.sub(r'\s*\([^)]*\)\s*ok\s*$', '', customer_text, flags=re.IGNORECASE).strip()  # Remove parentheses and "ok" after (with space)
-                customer_text = re.sub(r'\s*\([^)]*\)ok\s*$', '', customer_text, flags=re.IGNORECASE).strip()  # Remove parentheses and "ok" after (without space)
-                # Remove remaining parentheses (if still exists after extracting notes and quantity)
-                customer_text = re.sub(r'\s*\([^)]*\)\s*$', '', customer_text).strip()  # Remove text in parentheses at the end (if still exists)
-                customer_text = re.sub(r'\s+ok\s*$', '', customer_text, flags=re.IGNORECASE).strip()  # Remove "ok" at the end
-                # Normalize double spaces to single space
-                customer_text = re.sub(r'\s+', ' ', customer_text).strip()
-                
-                # Extract name and phone number
-                # Strategy: find all possible phone numbers, take the rightmost (last) one
-                # Pattern must be flexible to capture various formats
-                phone_patterns = [
-                    r'(\+62\s+\d{3}-\d{4}-\d{4})',  # +62 XXX-XXXX-XXXX format (3-4-4)
-                    r'(\+62\s+\d{3}-\d{4}-\d{3})',  # +62 XXX-XXXX-XXX format (3-4-3)
-                    r'(\+62\s+\d{3}-\d{3}-\d{3})',  # +62 XXX-XXX-XXX format (3-3-3)
-                    r'(\+62\s+\d{2}-\d{4}-\d{4})',  # +62 81-1234-5678 format (2-4-4)
-                    r'(\+62\s+\d{3}\s+\d{4}\s+\d{4})',  # +62 XXX XXXX XXXX format with spaces (3-4-4)
-                    r'(\+62\s+\d{2}\s+\d{4}\s+\d{4})',  # +62 81 1234 5678 format with spaces (2-4-4)
-                    r'(\+62\s+\d{2,3}[-.\s]\d{3,4}[-.\s]\d{3,4}[-.\s]\d{3,4})',  # +62 with separator
-                    r'(\+62\s*\d{2,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4})',  # +62 general format
-                    r'(0\d{2,3}[-.\s]?\d{3,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4})',  # 08 format with separator
-                    r'(0\d{10,12})(?=\s|$)',  # 08XXXXXXXXXX format without separator
-                ]
-                
-                phone_match = None
-                all_matches = []
-                
-                # Collect all matches from all patterns
-                for pattern in phone_patterns:
-                    matches = list(re.finditer(pattern, customer_text))
-                    all_matches.extend(matches)
-                
-                if all_matches:
-                    # Take the rightmost (last) one - this is usually the correct phone number
-                    phone_match = max(all_matches, key=lambda m: m.end())
-                
-                if phone_match:
-                    phone = phone_match.group(1).strip()
-                    name = customer_text[:phone_match.start()].strip()
-                    
-                    # Normalize phone number: if starts with 0, change to +62
-                    # Example: "08XXXXXXXXXX" -> "+62 XXX-XXXX-XXX"
-                    if phone.startswith('0'):
-                        # Remove all non-digits to get only numbers
-                        digits = re.sub(r'[^\d]', '', phone)
-                        if len(digits) >= 10 and digits.startswith('0'):
-                            # Remove leading 0
-                            digits = digits[1:]
-                            # Format to +62 with dash
-                            if len(digits) == 10:
-                                # Format: XXXXXXXXXX -> +62 XXX-XXXX-XXX
-                                phone = f"+62 {digits[0:3]}-{digits[3:7]}-{digits[7:]}"
-                            elif len(digits) == 11:
-                                # Format: XXXXXXXXXXX -> +62 XXX-XXXX-XXXX
-                                phone = f"+62 {digits[0:3]}-{digits[3:7]}-{digits[7:]}"
-                            elif len(digits) == 9:
-                                # Format: XXXXXXXXX -> +62 XXX-XXXX-XX
-                                phone = f"+62 {digits[0:3]}-{digits[3:7]}-{digits[7:]}"
-                else:
-                    phone = None
-                    name = customer_text.strip()
-                
-                # Only add if checked (has [x])
-                if checked:
-                    customer_key = get_customer_key(name, phone)
-                    
-                    # Save customer info
-                    if customer_key not in customers:
-                        customers[customer_key] = {
-                            'name': name,
-                            'phone': phone
-                        }
-                    
-                    # Add to item with quantity and notes
-                    current_item['customers'].append({
-                        'name': name,
-                        'phone': phone,
-                        'checked': checked,
-                        'quantity': quantity,
-                        'notes': notes  # Notes to be added to item name in report
-                    })
-        
-        # Add last item
-        if current_item:
-            items.append(current_item)
+                phone = None
+                name = customer_text.strip()
+            
+            # Add checked customer
+            customer_key = get_customer_key(name, phone)
+            
+            # Save customer info
+            if customer_key not in customers:
+                customers[customer_key] = {
+                    'name': name,
+                    'phone': phone,
+                    'sort_key': name.lower()  # Lowercased once, used for alphabetical sorting
+                }
+            
+            # Fold the entry into the report totals right away
+            # Key is (customer_key, item_name, notes) - bare item name is kept for the price lookup
+            tally[(customer_key, current_item['name'], notes or '')] += quantity
+            spender_totals[customer_key] += billed_price * quantity
+            current_item['total_quantity'] += quantity
+    
+    # Per-item totals only need the item-level sums, not the customer lists
+    # One [unit price, quantity, revenue] entry per item name, so the reports need a single lookup
+    item_stats = {}
+    total_omzet = 0
+    total_quantity = 0
+    total_items_sold = 0
+    for item in items:
+        quantity = item['total_quantity']
+        # Items with nothing sold (no checked entries, or only "(+0)") add nothing,
+        # and are kept out of item_stats so the reports never get zero rows
+        if quantity == 0:
+            continue
+        stats = item_stats.get(item['name'])
+        if stats is None:
+            # Unit price: first occurrence wins, same as the billing report
+            stats = item_stats[item['name']] = [price_by_name[item['name']], 0, 0]
+        revenue = item['price'] * quantity
+        stats[1] += quantity
+        stats[2] += revenue
+        total_items_sold += 1
+        total_omzet += revenue
+        total_quantity += quantity
+    
+    # Sort by customer, then by the item name as displayed in the billing report ("name (notes)").
+    # Sorting the bare (name, notes) tuple would differ when one name is a prefix of another,
+    # e.g. "Item (note)" must come after "Item #2" because ' ' + '(' sorts after ' ' + '#'
+    sorted_tally = sorted(
+        tally.items(),
+        key=lambda x: (x[0][0], f"{x[0][1]} {x[0][2]}" if x[0][2] else x[0][1])
+    )
+    
+    # Group by customer (each customer's items stay in the sorted order)
+    customer_items = {
+        customer_key: [(item_name, notes, quantity) for (_, item_name, notes), quantity in group]
+        for customer_key, group in groupby(sorted_tally, key=lambda x: x[0][0])
+    }
     
-    return items, customers
+    totals = {
+        'price_by_name': price_by_name,
+        'customer_items': customer_items,
+        'spender_totals': spender_totals,
+        'item_stats': item_stats,
+        'total_omzet': total_omzet,
+        'total_quantity': total_quantity,
+        'total_items_sold': total_items_sold,
+    }
+    
+    return items, customers, totals
 
 
+@lru_cache(maxsize=4096)
 def format_currency(amount):
     """Format number to Rupiah format: Rp. 125.000,-"""
-    formatted = f"{amount:,.0f}".replace(',', '.')
-    return f"Rp. {formatted},-"
+    return f"Rp. {format(amount, ',.0f').translate(_COMMA_TO_DOT)},-"
 
 
-def generate_billing_report(items, customers, filename):
+def generate_billing_report(totals, customers, filename):
     """Generate PDF billing report per customer"""
     doc = SimpleDocTemplate(filename, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    customer_header_style = ParagraphStyle(
-        'CustomerHeader',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=20
-    )
     
     # Title
-    story.append(Paragraph("Billing Report", title_style))
-    story.append(Spacer(1, 0.5*cm))
-    
-    # Group items by customer with quantity and notes
-    customer_purchases = defaultdict(list)
+    story = [
+        Paragraph("Billing Report", _TITLE_STYLE),
+        Spacer(1, 0.5*cm),
+    ]
     
-    for item in items:
-        for customer_entry in item['customers']:
-            if customer_entry['checked']:
-                customer_key = get_customer_key(
-                    customer_entry['name'],
-                    customer_entry['phone']
-                )
-                # Use quantity from customer_entry (default 1 if not exists)
-                quantity = customer_entry.get('quantity', 1)
-                # Add notes to item name if exists
-                item_name = item['name']
-                notes = customer_entry.get('notes')
-                if notes:
-                    item_name = f"{item['name']} {notes}"
-                
-                customer_purchases[customer_key].append({
-                    'item_name': item_name,
-                    'price': item['price'],
-                    'quantity': quantity
-                })
-    
-    # Count quantities per customer per item (with notes)
-    customer_items = defaultdict(lambda: defaultdict(int))
-    for customer_key, purchases in customer_purchases.items():
-        for purchase in purchases:
-            # Key is item_name with notes (if exists)
-            customer_items[customer_key][purchase['item_name']] += purchase['quantity']
+    # Quantities per customer per item (with notes), computed while parsing
+    customer_items = totals['customer_items']
+    price_by_name = totals['price_by_name']
     
     # Sort customers alphabetically by name
     sorted_customers = sorted(
         customers.items(),
-        key=lambda x: x[1]['name'].lower()
+        key=lambda x: x[1]['sort_key']
     )
     
     # Generate table for each customer
@@ -528,8 +829,6 @@ def generate_billing_report(items, customers, filename):
         customer_phone = customer_info['phone'] or "No phone number"
         
         header_text = f"<b>{customer_name}</b><br/>{customer_phone}"
-        story.append(Paragraph(header_text, customer_header_style))
-        story.append(Spacer(1, 0.3*cm))
         
         # Table data
         table_data = [['No', 'Item Name', 'Quantity', 'Unit Price', 'Subtotal']]
@@ -538,22 +837,12 @@ def generate_billing_report(items, customers, filename):
         total = 0
         row_num = 1
         
-        for item_name_with_notes, quantity in sorted(item_list.items()):
-            # Extract item name tanpa notes untuk mencari harga
-            # Notes format: "Item Name (notes)" atau "Item Name"
-            item_name = item_name_with_notes
-            # Hapus notes jika ada (format: "Item Name (notes)")
-            notes_match = re.search(r'^(.+?)\s*\([^)]+\)$', item_name_with_notes)
-            if notes_match:
-                item_name = notes_match.group(1).strip()
+        for item_name, notes, quantity in item_list:
+            # Add notes to item name for display if exists
+            item_name_with_notes = f"{item_name} {notes}" if notes else item_name
             
             # Find price for this item
-            item_price = None
-            for item in items:
-                if item['name'] == item_name:
-                    item_price = item['price']
-                    break
-            
+            item_price = price_by_name.get(item_name)
             if item_price is None:
                 continue
             
@@ -569,49 +858,27 @@ def generate_billing_report(items, customers, filename):
             ])
             row_num += 1
         
-        # Add grand total row - use Paragraph for bold text (Table does not support HTML)
-        grand_total_style = ParagraphStyle(
-            'GrandTotal',
-            parent=styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            alignment=TA_LEFT
-        )
-        grand_total_currency_style = ParagraphStyle(
-            'GrandTotalCurrency',
-            parent=styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            alignment=TA_RIGHT
-        )
-        
+        # Add grand total row - plain strings, bold font and alignment come from _BILLING_TABLE_STYLE
+        # (the amount sits in the unit price cell, which is spanned over the subtotal column)
         table_data.append([
             '',
-            Paragraph('GRAND TOTAL', grand_total_style),
+            'GRAND TOTAL',
             '',
-            '',
-            Paragraph(format_currency(total), grand_total_currency_style)
+            format_currency(total),
+            ''
         ])
         
         # Create table
-        table = Table(table_data, colWidths=[1*cm, 8*cm, 2*cm, 3*cm, 3*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, -1), (-1, -1), 11),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ecf0f1')),
-        ]))
+        table = Table(table_data, colWidths=_BILLING_COL_WIDTHS)
+        table.setStyle(_BILLING_TABLE_STYLE)
         
-        story.append(table)
-        story.append(Spacer(1, 1*cm))
+        # Customer header, table and trailing gap in one extend
+        story += [
+            Paragraph(header_text, _CUSTOMER_HEADER_STYLE),
+            Spacer(1, 0.3*cm),
+            table,
+            Spacer(1, 1*cm),
+        ]
     
     # Add page numbers
     def add_page_number(canvas, doc):
@@ -619,59 +886,25 @@ def generate_billing_report(items, customers, filename):
         canvas.setFont('Helvetica', 9)
         page_num = canvas.getPageNumber()
         text = f"Page {page_num}"
-        canvas.drawRightString(A4[0] - 2*cm, 2*cm, text)
+        canvas.drawRightString(_PAGE_NUMBER_X, _PAGE_NUMBER_Y, text)
         canvas.restoreState()
     
     doc.build(story, onFirstPage=add_page_number, onLaterPages=add_page_number)
-    print(f"[OK] Billing report successfully created: {filename}")
 
 
-def generate_top_spender_report(items, customers, filename):
+def generate_top_spender_report(totals, customers, filename):
     """Generate PDF top 5 spender report"""
     doc = SimpleDocTemplate(filename, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    # Title
-    story.append(Paragraph("Top 5 Spender Report", title_style))
-    story.append(Spacer(1, 0.5*cm))
     
-    # Calculate total spending per customer (with quantity calculation)
-    customer_totals = defaultdict(int)
-    customer_item_counts = defaultdict(lambda: defaultdict(int))
+    # Total spending per customer (with quantity calculation), computed while parsing
+    customer_totals = totals['spender_totals']
     
-    # Count quantities per customer per item (use quantity from customer_entry)
-    for item in items:
-        for customer_entry in item['customers']:
-            if customer_entry['checked']:
-                customer_key = get_customer_key(
-                    customer_entry['name'],
-                    customer_entry['phone']
-                )
-                quantity = customer_entry.get('quantity', 1)
-                customer_item_counts[customer_key][item['name']] += quantity
-    
-    # Calculate totals
-    for customer_key, item_counts in customer_item_counts.items():
-        for item in items:
-            if item['name'] in item_counts:
-                customer_totals[customer_key] += item['price'] * item_counts[item['name']]
-    
-    # Get top 5
-    top_spenders = sorted(
+    # Get top 5 (nlargest keeps ties in the same order as a full reverse sort)
+    top_spenders = heapq.nlargest(
+        5,
         customer_totals.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
+        key=itemgetter(1)
+    )
     
     # Table data
     table_data = [['No', 'Customer Name', 'Phone Number', 'Total Purchase']]
@@ -689,144 +922,60 @@ def generate_top_spender_report(items, customers, filename):
         ])
     
     # Create table
-    table = Table(table_data, colWidths=[1.5*cm, 6*cm, 5*cm, 4*cm])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-    ]))
-    
-    story.append(table)
+    table = Table(table_data, colWidths=_TOP_SPENDER_COL_WIDTHS)
+    table.setStyle(_TOP_SPENDER_TABLE_STYLE)
+    
+    # Title and table, assembled in one list
+    story = [
+        Paragraph("Top 5 Spender Report", _TITLE_STYLE),
+        Spacer(1, 0.5*cm),
+        table,
+    ]
     doc.build(story)
-    print(f"[OK] Top spender report successfully created: {filename}")
 
 
-def generate_top_item_report(items, customers, filename):
+def generate_top_item_report(totals, customers, filename):
     """Generate PDF top 5 item report"""
     doc = SimpleDocTemplate(filename, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    # Title
-    story.append(Paragraph("Top 5 Item Report", title_style))
-    story.append(Spacer(1, 0.5*cm))
     
-    # Calculate total quantity per item (use quantity from customer_entry)
-    item_totals = defaultdict(int)
+    # Total quantity per item, computed while parsing
+    item_totals = ((item_name, stats[1]) for item_name, stats in totals['item_stats'].items())
     
-    for item in items:
-        for customer_entry in item['customers']:
-            if customer_entry['checked']:
-                quantity = customer_entry.get('quantity', 1)
-                item_totals[item['name']] += quantity
-    
-    # Get top 5
-    top_items = sorted(
-        item_totals.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
-    
-    # Table data
-    table_data = [['No', 'Item Name', 'Quantity Sold']]
+    # Get top 5 (nlargest keeps ties in the same order as a full reverse sort)
+    top_items = heapq.nlargest(
+        5,
+        item_totals,
+        key=itemgetter(1)
+    )
     
-    for idx, (item_name, quantity) in enumerate(top_items, 1):
-        table_data.append([
-            str(idx),
-            item_name,
-            str(quantity)
-        ])
+    # Table data (header + one row per item, built in a single comprehension)
+    table_data = [['No', 'Item Name', 'Quantity Sold']] + [
+        [str(idx), item_name, str(quantity)]
+        for idx, (item_name, quantity) in enumerate(top_items, 1)
+    ]
     
     # Create table
-    table = Table(table_data, colWidths=[1.5*cm, 12*cm, 4*cm])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-    ]))
-    
-    story.append(table)
+    table = Table(table_data, colWidths=_TOP_ITEM_COL_WIDTHS)
+    table.setStyle(_TOP_ITEM_TABLE_STYLE)
+    
+    # Title and table, assembled in one list
+    story = [
+        Paragraph("Top 5 Item Report", _TITLE_STYLE),
+        Spacer(1, 0.5*cm),
+        table,
+    ]
     doc.build(story)
-    print(f"[OK] Top item report successfully created: {filename}")
 
 
-def generate_total_omzet_report(items, customers, filename):
+def generate_total_omzet_report(totals, customers, filename):
     """Generate PDF total revenue report"""
     doc = SimpleDocTemplate(filename, pagesize=A4)
-    story = []
-    styles = getSampleStyleSheet()
-    
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=16,
-        textColor=colors.HexColor('#1a1a1a'),
-        spaceAfter=30,
-        alignment=TA_CENTER
-    )
-    
-    # Title
-    story.append(Paragraph("Total Revenue Report", title_style))
-    story.append(Spacer(1, 0.5*cm))
-    
-    # Calculate total revenue per item and overall totals
-    item_revenue = defaultdict(int)
-    item_quantity = defaultdict(int)
-    total_omzet = 0
-    total_quantity = 0
-    total_items_sold = 0
-    
-    for item in items:
-        item_name = item['name']
-        item_price = item['price']
-        quantity = 0
-        
-        for customer_entry in item['customers']:
-            if customer_entry['checked']:
-                qty = customer_entry.get('quantity', 1)
-                quantity += qty
-                item_revenue[item_name] += item_price * qty
-                total_omzet += item_price * qty
-                total_quantity += qty
-        
-        if quantity > 0:
-            item_quantity[item_name] = quantity
-            total_items_sold += 1
-    
-    # Summary section
-    summary_style = ParagraphStyle(
-        'Summary',
-        parent=styles['Normal'],
-        fontSize=12,
-        fontName='Helvetica-Bold',
-        spaceAfter=20
-    )
     
-    story.append(Paragraph("Summary", summary_style))
-    story.append(Spacer(1, 0.2*cm))
+    # Price, quantity and revenue per item and overall totals, computed while parsing
+    item_stats = totals['item_stats']
+    total_omzet = totals['total_omzet']
+    total_quantity = totals['total_quantity']
+    total_items_sold = totals['total_items_sold']
     
     # Summary table
     summary_data = [
@@ -836,129 +985,161 @@ def generate_total_omzet_report(items, customers, filename):
         ['Total Customer', f"{len(customers)} customer"]
     ]
     
-    summary_table = Table(summary_data, colWidths=[8*cm, 8*cm])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#ecf0f1')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    
-    story.append(summary_table)
-    story.append(Spacer(1, 0.5*cm))
-    
-    # Detail per item section
-    detail_title_style = ParagraphStyle(
-        'DetailTitle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#2c3e50'),
-        spaceAfter=10,
-        spaceBefore=20
-    )
-    
-    story.append(Paragraph("Revenue Detail per Item", detail_title_style))
-    story.append(Spacer(1, 0.3*cm))
+    summary_table = Table(summary_data, colWidths=_OMZET_SUMMARY_COL_WIDTHS)
+    summary_table.setStyle(_OMZET_SUMMARY_TABLE_STYLE)
     
-    # Sort items by revenue (descending)
+    # Sort items by revenue (descending), flattened to (name, price, quantity, revenue)
+    # so the sort key can be a plain itemgetter
     sorted_items = sorted(
-        item_revenue.items(),
-        key=lambda x: x[1],
+        ((item_name, *stats) for item_name, stats in item_stats.items()),
+        key=itemgetter(3),
         reverse=True
     )
     
-    # Table data
-    table_data = [['No', 'Item Name', 'Quantity', 'Unit Price', 'Total Revenue']]
-    
-    for idx, (item_name, revenue) in enumerate(sorted_items, 1):
-        quantity = item_quantity[item_name]
-        # Find unit price
-        unit_price = None
-        for item in items:
-            if item['name'] == item_name:
-                unit_price = item['price']
-                break
-        
-        if unit_price is None:
-            continue
-        
-        table_data.append([
+    # Table data (one row per item, built in a single comprehension)
+    header = ['No', 'Item Name', 'Quantity', 'Unit Price', 'Total Revenue']
+    rows = [
+        [
             str(idx),
             item_name,
             str(quantity),
-            format_currency(unit_price),
+            format_currency(price),
             format_currency(revenue)
-        ])
-    
-    # Add grand total row
-    grand_total_style = ParagraphStyle(
-        'GrandTotal',
-        parent=styles['Normal'],
-        fontSize=11,
-        fontName='Helvetica-Bold',
-        alignment=TA_LEFT
-    )
-    grand_total_currency_style = ParagraphStyle(
-        'GrandTotalCurrency',
-        parent=styles['Normal'],
-        fontSize=11,
-        fontName='Helvetica-Bold',
-        alignment=TA_RIGHT
-    )
+        ]
+        for idx, (item_name, price, quantity, revenue) in enumerate(sorted_items, 1)
+    ]
     
-    table_data.append([
+    # Grand total row - plain strings, bold font and alignment come from _OMZET_TABLE_STYLE
+    # (the amount sits in the unit price cell, which is spanned over the revenue column)
+    total_row = [
         '',
-        Paragraph('TOTAL OMZET', grand_total_style),
+        'TOTAL OMZET',
         str(total_quantity),
-        '',
-        Paragraph(format_currency(total_omzet), grand_total_currency_style)
-    ])
+        format_currency(total_omzet),
+        ''
+    ]
     
-    # Create table
-    table = Table(table_data, colWidths=[1.5*cm, 7*cm, 2.5*cm, 3*cm, 3*cm])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#34495e')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (2, 0), (4, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -2), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTSIZE', (0, 1), (-1, -2), 10),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, -1), (-1, -1), 11),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ecf0f1')),
-    ]))
-    
-    story.append(table)
+    # Create tables: every chunk repeats the header, only the last one has the grand total row
+    last_start = (len(rows) - 1) // _TABLE_CHUNK_ROWS * _TABLE_CHUNK_ROWS if rows else 0
+    tables = [
+        Table([header] + rows[start:start + _TABLE_CHUNK_ROWS], colWidths=_OMZET_COL_WIDTHS, style=_OMZET_BODY_TABLE_STYLE)
+        for start in range(0, last_start, _TABLE_CHUNK_ROWS)
+    ]
+    tables.append(Table([header] + rows[last_start:] + [total_row], colWidths=_OMZET_COL_WIDTHS, style=_OMZET_TABLE_STYLE))
+    
+    # Title, summary section and detail per item section, assembled in one list
+    story = [
+        Paragraph("Total Revenue Report", _TITLE_STYLE),
+        Spacer(1, 0.5*cm),
+        Paragraph("Summary", _SUMMARY_STYLE),
+        Spacer(1, 0.2*cm),
+        summary_table,
+        Spacer(1, 0.5*cm),
+        Paragraph("Revenue Detail per Item", _DETAIL_TITLE_STYLE),
+        Spacer(1, 0.3*cm),
+    ] + tables
     doc.build(story)
-    print(f"[OK] Total revenue report successfully created: {filename}")
+
+
+def get_report_cache_key(input_file):
+    """
+    Hash the input file together with this script and the ReportLab version
+    (BLAKE2b, 128-bit hex digest).
+    Including the script and the ReportLab version means any code change or
+    library upgrade also invalidates cached reports.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(reportlab.Version.encode())
+    for path in (input_file, __file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def restore_cached_reports(cache_key, filenames):
+    """
+    Copy cached PDFs for this input into place.
+    Returns True only if every report was cached (otherwise nothing is copied).
+    """
+    cache_path = os.path.join(_REPORT_CACHE_DIR, cache_key)
+    cached_files = [os.path.join(cache_path, filename) for filename in filenames]
+    if not all(os.path.isfile(path) for path in cached_files):
+        return False
+    
+    for path, filename in zip(cached_files, filenames):
+        shutil.copyfile(path, filename)
+    # Mark as recently used for eviction
+    os.utime(cache_path)
+    return True
+
+
+def store_cached_reports(cache_key, filenames):
+    """
+    Copy freshly generated PDFs into the cache and evict the least recently
+    used entries beyond _REPORT_CACHE_SIZE.
+    """
+    cache_path = os.path.join(_REPORT_CACHE_DIR, cache_key)
+    os.makedirs(cache_path, exist_ok=True)
+    for filename in filenames:
+        shutil.copyfile(filename, os.path.join(cache_path, filename))
+    
+    entries = sorted(
+        (entry for entry in os.scandir(_REPORT_CACHE_DIR) if entry.is_dir()),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True
+    )
+    for entry in entries[_REPORT_CACHE_SIZE:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
 
 
 def main():
     input_file = 'input-file.txt'
     
+    reports = [
+        ('Billing report', generate_billing_report, 'laporan_penagihan.pdf'),
+        ('Top spender report', generate_top_spender_report, 'laporan_top_spender.pdf'),
+        ('Top item report', generate_top_item_report, 'laporan_top_item.pdf'),
+        ('Total revenue report', generate_total_omzet_report, 'laporan_total_omzet.pdf'),
+    ]
+    filenames = [filename for _, _, filename in reports]
+    
+    # Skip parsing and rendering if these exact reports were generated before
+    # (the cache is optional: if it cannot be read, the reports are simply generated again)
+    cache_key = get_report_cache_key(input_file)
+    try:
+        restored = restore_cached_reports(cache_key, filenames)
+    except OSError as e:
+        print(f"[WARNING] Report cache not readable, generating reports: {e}")
+        restored = False
+    if restored:
+        print("[OK] Input file unchanged, reusing cached reports:")
+        for label, _, filename in reports:
+            print(f"[OK] {label} restored: {filename}")
+        return
+    
     print("Starting file parsing process...")
-    items, customers = parse_input_file(input_file)
+    items, customers, totals = parse_input_file(input_file)
     
     print(f"[OK] Found {len(items)} items")
     print(f"[OK] Found {len(customers)} customers")
     
     print("\nGenerating PDF reports...")
-    generate_billing_report(items, customers, 'laporan_penagihan.pdf')
-    generate_top_spender_report(items, customers, 'laporan_top_spender.pdf')
-    generate_top_item_report(items, customers, 'laporan_top_item.pdf')
-    generate_total_omzet_report(items, customers, 'laporan_total_omzet.pdf')
+    # Reports are independent (no shared state), so build them in parallel worker processes
+    with ProcessPoolExecutor(max_workers=len(reports)) as executor:
+        futures = [
+            (label, filename, executor.submit(generate_report, totals, customers, filename))
+            for label, generate_report, filename in reports
+        ]
+        # Report results in a fixed order (workers finish in any order)
+        for label, filename, future in futures:
+            future.result()
+            print(f"[OK] {label} successfully created: {filename}")
+    
+    # The reports are already written, so a cache that cannot be written (e.g. read-only folder) is not an error
+    try:
+        store_cached_reports(cache_key, filenames)
+    except OSError as e:
+        print(f"[WARNING] Reports not saved to cache: {e}")
     
     print("\n[OK] All reports successfully created!")
 
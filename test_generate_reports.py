@@ -0,0 +1,190 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import generate_reports
+
+
+def parse_text(text):
+    """Parse input text through a temporary file and return (items, customers, totals)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'input-file.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return generate_reports.parse_input_file(path)
+
+
+class PhoneMatchTest(unittest.TestCase):
+    def test_two_phones_take_the_last_number(self):
+        match = generate_reports.find_phone_match("Budi 081234567890 082233445566")
+        self.assertEqual(match.group(0), "082233445566")
+
+    def test_two_phones_are_not_spliced(self):
+        match = generate_reports.find_phone_match("Rina +62 391-0194-653 08498690914")
+        self.assertEqual(match.group(0), "08498690914")
+
+    def test_three_phones_take_the_last_number(self):
+        match = generate_reports.find_phone_match("Ani +62 812-3456-7890 0812 3456 7890 081398765432")
+        self.assertEqual(match.group(0), "081398765432")
+
+    def test_no_phone(self):
+        self.assertIsNone(generate_reports.find_phone_match("Customer Without Phone"))
+
+    def test_two_phone_line_customer(self):
+        customers = parse_text("Product A 125rb\n- [x] Budi 081234567890 082233445566\n")[1]
+        self.assertEqual(
+            [(key, info['name'], info['phone']) for key, info in customers.items()],
+            [('082233445566_budi 081234567890', 'Budi 081234567890', '+62 822-3344-5566')]
+        )
+
+
+class TrailingNoiseTest(unittest.TestCase):
+    def test_stacked_trailing_groups_are_stripped(self):
+        self.assertEqual(
+            generate_reports.remove_trailing_noise_from_customer_name("Budi (lunas) ok (transfer)ok ok (x)"),
+            "Budi"
+        )
+
+    def test_text_before_the_groups_is_kept(self):
+        self.assertEqual(generate_reports.remove_trailing_noise_from_customer_name("Budi x)ok"), "Budi x)ok")
+
+    def test_long_stacked_line_finishes_quickly(self):
+        line = "- [x] Budi " + "(lunas) ok ok " * 200 + "081234567890 x)"
+        start = time.perf_counter()
+        customers = parse_text("Product A 125rb\n" + line + "\n")[1]
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(customers), 1)
+
+
+class BillingRowOrderTest(unittest.TestCase):
+    def test_rows_sorted_by_displayed_name(self):
+        totals = parse_text(
+            "Item 100rb\n- [x] Budi (note)\n"
+            "Item #2 50rb\n- [x] Budi\n"
+            "Item 2 75rb\n- [x] Budi\n"
+        )[2]
+        rows = totals['customer_items']['NO_PHONE_budi']
+        self.assertEqual(
+            [f"{name} {notes}" if notes else name for name, notes, _ in rows],
+            ['Item #2', 'Item (note)', 'Item 2']
+        )
+
+
+class ReportFiguresTest(unittest.TestCase):
+    def test_spending_counts_repeated_item_names_once(self):
+        totals = parse_text(
+            "Product A 125rb\n- [x] Multi\n"
+            "Product A 125rb\n- [x] Other\n"
+        )[2]
+        # One unit bought, even though two items share the name
+        self.assertEqual(totals['spender_totals']['NO_PHONE_multi'], 125000)
+
+    def test_example_input_top_spenders(self):
+        example = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input-file.example.txt')
+        with open(example, encoding='utf-8') as f:
+            totals = parse_text(f.read())[2]
+        self.assertEqual(
+            sorted(totals['spender_totals'].values(), reverse=True)[:5],
+            [605000, 585000, 570000, 375000, 285000]
+        )
+        self.assertEqual(totals['spender_totals']['081234567890_multi customer'], 605000)
+
+
+    def test_revenue_quantity_sums_items_with_the_same_name(self):
+        totals = parse_text(
+            "Product A 125rb\n- [x] Budi\n"
+            "Product A 125rb\n- [x] Ani\n- [x] Cici\n"
+        )[2]
+        # [unit price, quantity, revenue]: quantity matches the summed revenue
+        self.assertEqual(totals['item_stats']['Product A'], [125000, 3, 375000])
+
+
+    def test_item_name_ending_in_parentheses_is_billed(self):
+        totals = parse_text("Produk Beta(warna) 100rb\n- [x] Budi\n")[2]
+        # "(warna)" is part of the name, not a note, so the billing price lookup finds it
+        self.assertEqual(totals['customer_items']['NO_PHONE_budi'], [('Produk Beta(warna)', '', 1)])
+        self.assertEqual(totals['price_by_name']['Produk Beta(warna)'], 100000)
+        self.assertEqual(totals['spender_totals']['NO_PHONE_budi'], 100000)
+
+
+    def test_zero_quantity_items_are_left_out(self):
+        totals = parse_text(
+            "Produk Z 100rb\n- [x] Ani (+0)\n"
+            "Produk Y 50rb\n- [x] Budi\n"
+        )[2]
+        # "Produk Z" sold nothing, so it has no row in the revenue and top item reports
+        self.assertEqual(totals['item_stats'], {'Produk Y': [50000, 1, 50000]})
+        self.assertEqual(totals['total_items_sold'], 1)
+
+
+class ReportCacheTest(unittest.TestCase):
+    FILENAMES = ['a.pdf', 'b.pdf']
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, 'cache')
+        self.work_dir = os.path.join(tmp.name, 'work')
+        os.makedirs(self.work_dir)
+        cwd = os.getcwd()
+        os.chdir(self.work_dir)
+        self.addCleanup(os.chdir, cwd)
+        patcher = mock.patch.object(generate_reports, '_REPORT_CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_reports(self, content):
+        for filename in self.FILENAMES:
+            with open(filename, 'w') as f:
+                f.write(content)
+
+    def test_miss(self):
+        self.assertFalse(generate_reports.restore_cached_reports('key', self.FILENAMES))
+
+    def test_hit(self):
+        self.write_reports('first')
+        generate_reports.store_cached_reports('key', self.FILENAMES)
+        self.write_reports('changed')
+        self.assertTrue(generate_reports.restore_cached_reports('key', self.FILENAMES))
+        for filename in self.FILENAMES:
+            with open(filename) as f:
+                self.assertEqual(f.read(), 'first')
+
+    def test_eviction_keeps_most_recently_used(self):
+        self.write_reports('report')
+        keys = [f'key{i}' for i in range(generate_reports._REPORT_CACHE_SIZE + 1)]
+        for i, key in enumerate(keys[:-1]):
+            generate_reports.store_cached_reports(key, self.FILENAMES)
+            # Fixed modification times: key0 is the least recently used
+            os.utime(os.path.join(self.cache_dir, key), (1000 + i, 1000 + i))
+        generate_reports.store_cached_reports(keys[-1], self.FILENAMES)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), sorted(keys[1:]))
+        self.assertFalse(generate_reports.restore_cached_reports(keys[0], self.FILENAMES))
+
+    def run_main(self):
+        with open('input-file.txt', 'w', encoding='utf-8') as f:
+            f.write("Product A 125rb\n- [x] Budi 081234567890\n")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            generate_reports.main()
+        self.assertIn('All reports successfully created', output.getvalue())
+        self.assertTrue(os.path.isfile('laporan_penagihan.pdf'))
+        return output.getvalue()
+
+    def test_unwritable_cache_still_generates_reports(self):
+        with mock.patch.object(generate_reports.os, 'makedirs', side_effect=PermissionError('read-only')):
+            output = self.run_main()
+        self.assertIn('[WARNING] Reports not saved to cache', output)
+
+    def test_unreadable_cache_still_generates_reports(self):
+        with mock.patch.object(generate_reports, 'restore_cached_reports', side_effect=PermissionError('denied')):
+            output = self.run_main()
+        self.assertIn('[WARNING] Report cache not readable', output)
+
+
+if __name__ == '__main__':
+    unittest.main()